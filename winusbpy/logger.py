@@ -7,7 +7,8 @@ FMT_LOGGING = '%(asctime)s|%(name)s|%(filename)s|%(levelname)s: %(message)s'
 class Logger:
     def __init__(self, name: str, log_file: Path | None = None, level: int = logging.INFO) -> None:
         self.logger = logging.getLogger(name)
-        if not self.logger.handlers:  # Prevent duplicate handlers
+        if not getattr(self.logger, "_winusbpy_configured", False):  # Prevent duplicate handlers
+            self.logger._winusbpy_configured = True
             self.logger.setLevel(level)
 
             formatter = logging.Formatter(FMT_LOGGING)
@@ -25,3 +26,16 @@ class Logger:
 
     def get_logger(self) -> logging.Logger:
         return self.logger
+
+
+_logger_cache: dict[tuple, logging.Logger] = {}
+
+def get_logger(name: str, log_file: Path | None = None, level: int = logging.INFO) -> logging.Logger:
+    """Return a configured logger, building it only the first time a
+    (name, log_file, level) combination is seen."""
+    key = (name, log_file, level)
+    logger = _logger_cache.get(key)
+    if logger is None:
+        logger = Logger(name, log_file=log_file, level=level).get_logger()
+        _logger_cache[key] = logger
+    return logger
@@ -1,14 +1,8 @@
-from ctypes import c_byte, c_ubyte, c_ushort, c_ulong, c_void_p, byref, c_wchar_p
+from ctypes import c_byte, c_ubyte, c_ushort, c_ulong, c_void_p, sizeof
 from ctypes import Structure, POINTER
 from ctypes.wintypes import HANDLE, LPVOID, DWORD, WORD, BOOL, WCHAR
-from ctypes import windll, oledll
 from functools import total_ordering
 
-_ole32 = oledll.ole32
-
-_StringFromCLSID = _ole32.StringFromCLSID
-_CoTaskMemFree = windll.ole32.CoTaskMemFree
-
 
 """Flags controlling what is included in the device information set built by SetupDiGetClassDevs"""
 DIGCF_DEFAULT = 0x00000001
@@ -37,6 +31,7 @@ PIPE_TYPE_INTERRUPT = 3
 
 
 """ Errors """
+ERROR_INSUFFICIENT_BUFFER = 122
 ERROR_IO_INCOMPLETE = 996
 ERROR_IO_PENDING = 997
 
@@ -73,32 +68,39 @@ class LpSecurityAttributes(Structure):
                 ("b_Inherit_handle", BOOL)]
 
 
+BYTE_ARRAY_8 = c_byte * 8
+
+
 class GUID(Structure):
     _fields_ = [("data1", DWORD), ("data2", WORD),
-                ("data3", WORD), ("data4", c_byte * 8)]
+                ("data3", WORD), ("data4", BYTE_ARRAY_8)]
 
     def __repr__(self):
         return f'GUID("{str(self)}")'
 
     def __str__(self):
-        p = c_wchar_p()
-        _StringFromCLSID(byref(self), byref(p))
-        result = p.value
-        _CoTaskMemFree(p)
+        # Format in Python and cache: the GUIDs used here are constants, and
+        # StringFromCLSID cost a COM allocation/free per call
+        result = self.__dict__.get("_str")
+        if result is None:
+            d4 = bytes(self.data4)
+            result = "{%08X-%04X-%04X-%02X%02X-%s}" % (
+                self.data1, self.data2, self.data3, d4[0], d4[1], d4[2:].hex().upper())
+            self._str = result
         return result
 
     def __eq__(self, other):
         if isinstance(other, GUID):
-            return (self.data1, self.data2, self.data3, bytes(self.data4)) == (other.data1, other.data2, other.data3, bytes(other.data4))
+            return bytes(self) == bytes(other)  # Raw 16-byte compare, no field unpacking
         return False
 
     def __hash__(self):
-        # Hashing the GUID based on its fields
-        return hash((self.data1, self.data2, self.data3, bytes(self.data4)))
+        # Hashing the GUID based on its raw memory
+        return hash(bytes(self))
 
     def __bool__(self):
         # Check if the GUID is null or not
-        return not all(getattr(self, field) == 0 for field in ('data1', 'data2', 'data3', 'data4'))
+        return any(bytes(self))
 
     @total_ordering
     class GUIDComparison:
@@ -131,3 +133,8 @@ class SpDeviceInterfaceData(Structure):
 
 class SpDeviceInterfaceDetailData(Structure):
     _fields_ = [("cb_size", DWORD), ("device_path", WCHAR * 1)]  # devicePath array!!!
+
+
+# cb_size is the size of the fixed part of the structure (DWORD + one WCHAR),
+# padded to pointer alignment: 8 on 64-bit, 6 on 32-bit
+SP_DEVICE_INTERFACE_DETAIL_DATA_CB_SIZE = 8 if sizeof(c_void_p) == 8 else 6
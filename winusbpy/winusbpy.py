@@ -1,25 +1,60 @@
 import struct
+import time
 import ctypes
 from enum import Enum
 from dataclasses import dataclass
-from ctypes import c_byte, byref, sizeof, c_ulong, resize, wstring_at, c_void_p, c_ubyte, create_string_buffer, WinError
+from ctypes import byref, sizeof, c_ulong, resize, wstring_at, c_void_p, c_ubyte, create_string_buffer, WinError
 from ctypes.wintypes import DWORD, HANDLE
 from typing import Optional
 from pathlib import Path
 from .winusb import WinUSBApi
-from .winusbclasses import GUID, DIGCF_ALLCLASSES, DIGCF_DEFAULT, DIGCF_PRESENT, DIGCF_PROFILE, DIGCF_DEVICE_INTERFACE, \
+from .winusbclasses import GUID, BYTE_ARRAY_8, DIGCF_ALLCLASSES, DIGCF_DEFAULT, DIGCF_PRESENT, DIGCF_PROFILE, DIGCF_DEVICE_INTERFACE, \
     SpDeviceInterfaceData,  SpDeviceInterfaceDetailData, SpDevinfoData, GENERIC_WRITE, GENERIC_READ, FILE_SHARE_WRITE, \
     FILE_SHARE_READ, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, FILE_FLAG_OVERLAPPED, INVALID_HANDLE_VALUE, \
-    UsbInterfaceDescriptor, PipeInfo, ERROR_IO_INCOMPLETE, ERROR_IO_PENDING, Overlapped
+    UsbInterfaceDescriptor, PipeInfo, ERROR_INSUFFICIENT_BUFFER, ERROR_IO_INCOMPLETE, ERROR_IO_PENDING, Overlapped, \
+    SP_DEVICE_INTERFACE_DETAIL_DATA_CB_SIZE
 from .winusbutils import SetupDiGetClassDevs, SetupDiEnumDeviceInterfaces, SetupDiGetDeviceInterfaceDetail, is_device, \
     CreateFile, WinUsb_Initialize, Close_Handle, WinUsb_Free, GetLastError, WinUsb_QueryDeviceInformation, \
-    WinUsb_GetAssociatedInterface, WinUsb_QueryInterfaceSettings, WinUsb_QueryPipe, WinUsb_ControlTransfer, \
-    WinUsb_WritePipe, WinUsb_ReadPipe, WinUsb_GetOverlappedResult, SetupDiGetDeviceRegistryProperty, \
-    WinUsb_SetPipePolicy, WinUsb_FlushPipe, SPDRP_FRIENDLYNAME
-from .logger import Logger, logging
+    WinUsb_GetAssociatedInterface, WinUsb_QueryInterfaceSettings, WinUsb_QueryPipe, CreateEvent, ResetEvent, \
+    SetupDiGetDeviceRegistryProperty, WinUsb_SetPipePolicy, WinUsb_FlushPipe, SPDRP_FRIENDLYNAME
+from .logger import get_logger, logging
+
+_IS_64BIT = struct.calcsize('P') * 8 == 64
+
+# Shared zero constant for alternate-setting arguments; never mutated
+_UBYTE_ZERO = c_ubyte(0)
+
+# Keyword-to-DIGCF bit lookup used by WinUsbPy._compute_flags
+_DIGCF_FLAG_MAP = {
+    "default": DIGCF_DEFAULT,
+    "present": DIGCF_PRESENT,
+    "allclasses": DIGCF_ALLCLASSES,
+    "profile": DIGCF_PROFILE,
+    "deviceinterface": DIGCF_DEVICE_INTERFACE,
+}
+
+# Structure sizes are invariant; compute them once instead of per enumeration
+_SIZEOF_DWORD = sizeof(DWORD)
+_SP_DEVICE_INTERFACE_DATA_SIZE = sizeof(SpDeviceInterfaceData)
+_SP_DEVINFO_DATA_SIZE = sizeof(SpDevinfoData)
 
 def is_64bit():
-    return struct.calcsize('P') * 8 == 64
+    return _IS_64BIT
+
+_OVERLAPPED_HEVENT_OFFSET = Overlapped.hEvent.offset
+
+def _reset_overlapped(ol:Overlapped):
+    """Zero every Overlapped field before hEvent with one memset instead of
+    five attribute stores."""
+    ctypes.memset(byref(ol), 0, _OVERLAPPED_HEVENT_OFFSET)
+
+@dataclass
+class OverlappedReadRequest:
+    """One in-flight overlapped read: its Overlapped block and receive buffer."""
+    ol: Overlapped
+    buf: ctypes.Array
+    buflen: int
+
 
 @dataclass
 class UsbDevice:
@@ -33,8 +68,17 @@ class UsbDevice:
     logging_filepath:Optional[Path] = None
 
     def __post_init__(self):
-        self.logger = Logger(self.name, level=self.logging_level, log_file=self.logging_filepath).get_logger()
-        self.logger.debug(f"UsbDevice initialized: {self}")
+        self.logger = get_logger(self.name, level=self.logging_level, log_file=self.logging_filepath)
+        # Reusable transfer state so read/write do not allocate per call
+        self._rx_buf = None
+        self._rx_len = 0
+        self._read = c_ulong(0)
+        self._written = c_ulong(0)
+        self.olread_ol = None
+        self._olread_pool: list[OverlappedReadRequest] = []
+        self._olread_head = 0
+        self._iface_handles: dict[int, c_void_p] = {}
+        self.logger.debug("UsbDevice initialized: %s", self)
 
     def init_device(self) -> bool:
         # Open the device
@@ -65,9 +109,22 @@ class UsbDevice:
     def get_last_error_code(self):
         return self.api.exec_function_kernel32(GetLastError)
 
+    def _release_interface_handles(self):
+        for handle in self._iface_handles.values():
+            self.api.exec_function_winusb(WinUsb_Free, handle)
+        self._iface_handles = {}
+
     def close_device(self):
+        self._release_interface_handles()
         result_file = self.api.exec_function_kernel32(Close_Handle, self.handle_file)
         result_winusb = self.api.exec_function_winusb(WinUsb_Free, self.handle_winusb)
+        if self.olread_ol is not None and self.olread_ol.hEvent:
+            self.api.exec_function_kernel32(Close_Handle, self.olread_ol.hEvent)
+            self.olread_ol = None
+        for request in self._olread_pool:
+            if request.ol.hEvent:
+                self.api.exec_function_kernel32(Close_Handle, request.ol.hEvent)
+        self._olread_pool = []
         return result_file != 0 and result_winusb != 0
 
     def query_device_info(self, query=1):
@@ -85,12 +142,17 @@ class UsbDevice:
         if self.interface_index != -1:
             temp_handle_winusb = self.handle_winusb
             if self.interface_index != 0:
-                result = self.api.exec_function_winusb(WinUsb_GetAssociatedInterface, self.handle_winusb,
-                                                    c_ubyte(index), byref(temp_handle_winusb))
-                if result == 0:
-                    return False
+                temp_handle_winusb = self._iface_handles.get(index)
+                if temp_handle_winusb is None:
+                    # Fresh handle target: byref on self.handle_winusb would overwrite it
+                    temp_handle_winusb = c_void_p()
+                    result = self.api.exec_function_winusb(WinUsb_GetAssociatedInterface, self.handle_winusb,
+                                                        c_ubyte(index), byref(temp_handle_winusb))
+                    if result == 0:
+                        return False
+                    self._iface_handles[index] = temp_handle_winusb
             interface_descriptor = UsbInterfaceDescriptor()
-            result = self.api.exec_function_winusb(WinUsb_QueryInterfaceSettings, temp_handle_winusb, c_ubyte(0),
+            result = self.api.exec_function_winusb(WinUsb_QueryInterfaceSettings, temp_handle_winusb, _UBYTE_ZERO,
                                                 byref(interface_descriptor))
             if result != 0:
                 return interface_descriptor
@@ -104,13 +166,15 @@ class UsbDevice:
                                             byref(self.handle_winusb))
         if result != 0:
             self.interface_index = index
+            self._release_interface_handles()  # Cached handles belonged to the old interface
             return True
         else:
             return False
 
-    def query_pipe(self, pipe_index):
-        pipe_info = PipeInfo()
-        result = self.api.exec_function_winusb(WinUsb_QueryPipe, self.handle_winusb, c_ubyte(0), pipe_index,
+    def query_pipe(self, pipe_index, out:PipeInfo=None):
+        # Callers enumerating pipes can pass one PipeInfo to reuse per query
+        pipe_info = out if out is not None else PipeInfo()
+        result = self.api.exec_function_winusb(WinUsb_QueryPipe, self.handle_winusb, _UBYTE_ZERO, pipe_index,
                                             byref(pipe_info))
         if result != 0:
             return pipe_info
@@ -120,7 +184,14 @@ class UsbDevice:
     def control_transfer(self, setup_packet:bytes, buff=None):
         if buff != None:
             if setup_packet.length > 0:  # Host 2 Device
-                buff = (c_ubyte * setup_packet.length)(*buff)
+                buffer_type = c_ubyte * setup_packet.length
+                try:
+                    buff = buffer_type.from_buffer(buff)  # Zero-copy on a writable buffer
+                except TypeError:
+                    try:
+                        buff = buffer_type.from_buffer_copy(buff)  # Read-only input (e.g. bytes)
+                    except TypeError:
+                        buff = buffer_type(*buff)  # Plain sequence of ints
                 buffer_length = setup_packet.length
             else:  # Device 2 Host
                 buff = (c_ubyte * setup_packet.length)()
@@ -129,20 +200,24 @@ class UsbDevice:
             buff = c_ubyte()
             buffer_length = 0
 
-        result = self.api.exec_function_winusb(WinUsb_ControlTransfer, self.handle_winusb, setup_packet, byref(buff),
+        result = self.api._WinUsb_ControlTransfer(self.handle_winusb, setup_packet, byref(buff),
                                             c_ulong(buffer_length), byref(c_ulong(0)), None)
         return {"result": result != 0, "buffer": [buff]}
 
     def write(self, pipe_id:int, write_buffer:bytearray):
         buffer_type = c_ubyte * len(write_buffer)
-        write_buffer = buffer_type(*write_buffer)
-        written = c_ulong(0)
+        try:
+            write_buffer = buffer_type.from_buffer(write_buffer)  # Zero-copy on a bytearray
+        except TypeError:
+            write_buffer = buffer_type.from_buffer_copy(write_buffer)  # Read-only input (e.g. bytes)
+        written = self._written
+        written.value = 0
 
         if not self.handle_winusb:
             raise ValueError("WinUSB handle is not initialized")
 
-        result = self.api.exec_function_winusb(
-            WinUsb_WritePipe, self.handle_winusb, c_ubyte(pipe_id), 
+        result = self.api._WinUsb_WritePipe(
+            self.handle_winusb, c_ubyte(pipe_id),
             write_buffer, c_ulong(len(write_buffer)), byref(written), None
         )
 
@@ -151,21 +226,22 @@ class UsbDevice:
 
         return written.value
 
-    def read(self, pipe_id: int, length_buffer: int) -> bytearray:
-        read_buffer = (c_ubyte * length_buffer)()
-        read = c_ulong(0)
+    def read(self, pipe_id: int, length_buffer: int) -> bytes:
+        if self._rx_len < length_buffer:  # Grow the reusable buffer only when undersized
+            self._rx_buf = (c_ubyte * length_buffer)()
+            self._rx_len = length_buffer
+        read_buffer = self._rx_buf
+        read = self._read
+        read.value = 0
 
         # Call WinUsb_ReadPipe
-        result = self.api.exec_function_winusb(
-            WinUsb_ReadPipe, self.handle_winusb, c_ubyte(pipe_id),
+        result = self.api._WinUsb_ReadPipe(
+            self.handle_winusb, c_ubyte(pipe_id),
             read_buffer, c_ulong(length_buffer), byref(read), None
         )
-        
+
         if result != 0:
-            if read.value != length_buffer:
-                return bytearray(read_buffer[:read.value])  # Return only the valid bytes
-            else:
-                return bytearray(read_buffer)  # Return the entire buffer
+            return ctypes.string_at(read_buffer, read.value)  # One copy of just the valid bytes
         else:
             error_code = self.get_last_error_code()
             if error_code != 0:
@@ -195,21 +271,19 @@ class UsbDevice:
         return result
 
     def _overlapped_read_do(self, pipe_id:int) -> bool:
-        self.olread_ol.Internal = 0
-        self.olread_ol.InternalHigh = 0
-        self.olread_ol.Offset = 0
-        self.olread_ol.OffsetHigh = 0
-        self.olread_ol.Pointer = 0
-        self.olread_ol.hEvent = 0                
-        result = self.api.exec_function_winusb(WinUsb_ReadPipe, self.handle_winusb, c_ubyte(pipe_id), self.olread_buf, 
+        _reset_overlapped(self.olread_ol)
+        self.api.exec_function_kernel32(ResetEvent, self.olread_ol.hEvent)
+        result = self.api._WinUsb_ReadPipe(self.handle_winusb, c_ubyte(pipe_id), self.olread_buf,
                                             c_ulong(self.olread_buflen), byref(c_ulong(0)), byref(self.olread_ol))
         if result != 0:
             return True
         else:
             return False
-                
+
     def overlapped_read_init(self, pipe_id, length_buffer) -> bool:
         self.olread_ol = Overlapped()
+        # Manual-reset event reused across every read on this pipe
+        self.olread_ol.hEvent = self.api.exec_function_kernel32(CreateEvent, None, True, False, None)
         self.olread_buf = create_string_buffer(length_buffer)
         self.olread_buflen = length_buffer
         return self._overlapped_read_do(pipe_id)
@@ -217,7 +291,7 @@ class UsbDevice:
     def overlapped_read(self, pipe_id:int) -> str:
         """ keep on reading overlapped, return bytearray, empty if nothing to read, None if err"""
         rl = c_ulong(0)
-        result = self.api.exec_function_winusb(WinUsb_GetOverlappedResult, self.handle_winusb, byref(self.olread_ol),byref(rl),True)
+        result = self.api._WinUsb_GetOverlappedResult(self.handle_winusb, byref(self.olread_ol), byref(rl), True)
         if result == 0:
             last_error = self.get_last_error_code()
             if last_error == ERROR_IO_PENDING or \
@@ -230,103 +304,172 @@ class UsbDevice:
             # self._overlapped_read_do(pipe_id)
             return ret
 
-def is_64bit():
-    return struct.calcsize('P') * 8 == 64
+    def _overlapped_pool_submit(self, pipe_id:int, request:OverlappedReadRequest) -> bool:
+        _reset_overlapped(request.ol)
+        self.api.exec_function_kernel32(ResetEvent, request.ol.hEvent)
+        result = self.api._WinUsb_ReadPipe(self.handle_winusb, c_ubyte(pipe_id), request.buf,
+                                            c_ulong(request.buflen), byref(c_ulong(0)), byref(request.ol))
+        if result != 0:
+            return True
+        # Overlapped submissions normally come back pending; anything else failed
+        return self.get_last_error_code() == ERROR_IO_PENDING
+
+    def overlapped_read_pool_init(self, pipe_id:int, length_buffer:int, depth:int=2) -> bool:
+        """Queue `depth` overlapped reads so a request is always in flight."""
+        self._olread_pool = []
+        self._olread_head = 0
+        for _ in range(depth):
+            ol = Overlapped()
+            ol.hEvent = self.api.exec_function_kernel32(CreateEvent, None, True, False, None)
+            request = OverlappedReadRequest(ol, create_string_buffer(length_buffer), length_buffer)
+            self._olread_pool.append(request)
+            if not self._overlapped_pool_submit(pipe_id, request):
+                # A half-queued slot would be reported as a successful 0-byte
+                # read forever, so tear the pool down and fail the init
+                for req in self._olread_pool:
+                    if req.ol.hEvent:
+                        self.api.exec_function_kernel32(Close_Handle, req.ol.hEvent)
+                self._olread_pool = []
+                return False
+        return True
+
+    def overlapped_read_pool(self, pipe_id:int):
+        """ harvest the oldest in-flight read and resubmit it, return bytearray, str(error) if still pending, None if err"""
+        request = self._olread_pool[self._olread_head]
+        rl = c_ulong(0)
+        result = self.api._WinUsb_GetOverlappedResult(self.handle_winusb, byref(request.ol), byref(rl), False)
+        if result == 0:
+            last_error = self.get_last_error_code()
+            if last_error == ERROR_IO_PENDING or \
+                last_error == ERROR_IO_INCOMPLETE:
+                return str(last_error)
+            else:
+                return None
+        else:
+            ret = request.buf[0:rl.value]
+            if not self._overlapped_pool_submit(pipe_id, request):
+                raise ctypes.WinError(self.get_last_error_code())
+            self._olread_head = (self._olread_head + 1) % len(self._olread_pool)
+            return ret
 
-byte_array = c_byte * 8
 class WinUsbPy(object):
     class GUIDEnum(Enum):
-        USB_DEVICE = GUID(0xA5DCBF10, 0x6530, 0x11D2, byte_array(0x90, 0x1F, 0x00, 0xC0, 0x4F, 0xB9, 0x51, 0xED))
-        USB_WINUSB = GUID(0xdee824ef, 0x729b, 0x4a0e, byte_array(0x9c, 0x14, 0xb7, 0x11, 0x7d, 0x33, 0xa8, 0x17))
-        USB_COMPOSITE = GUID(0x36FC9E60, 0xC465, 0x11CF, byte_array(0x80, 0x56, 0x44, 0x45, 0x53, 0x54, 0x00, 0x00))
+        USB_DEVICE = GUID(0xA5DCBF10, 0x6530, 0x11D2, BYTE_ARRAY_8(0x90, 0x1F, 0x00, 0xC0, 0x4F, 0xB9, 0x51, 0xED))
+        USB_WINUSB = GUID(0xdee824ef, 0x729b, 0x4a0e, BYTE_ARRAY_8(0x9c, 0x14, 0xb7, 0x11, 0x7d, 0x33, 0xa8, 0x17))
+        USB_COMPOSITE = GUID(0x36FC9E60, 0xC465, 0x11CF, BYTE_ARRAY_8(0x80, 0x56, 0x44, 0x45, 0x53, 0x54, 0x00, 0x00))
         
+    ENUM_CACHE_TTL = 2.0  # Seconds a cached enumeration stays valid
+
     def __init__(self, logging_level=logging.INFO, log_filepath: Optional[Path]=None):
         self.logging_level = logging_level
         self.log_filepath = log_filepath
         self.api = WinUSBApi()
+        self._enum_cache: dict[tuple, tuple[float, list[UsbDevice]]] = {}
+        self._friendly_name_buf = ctypes.create_unicode_buffer(250)
+
+    def get_usb_devices(self, guid:GUIDEnum, friendly_names: bool = True, **kwargs) -> list[UsbDevice]:
+        """Retrieve a dictionary of connected USB devices with their paths.
 
-    def get_usb_devices(self, guid:GUIDEnum, **kwargs) -> list[UsbDevice]:
-        """Retrieve a dictionary of connected USB devices with their paths."""
+        Pass friendly_names=False to skip the registry lookup per device and
+        name each device by its path instead.
+        """
         flags = self._compute_flags(**kwargs)
+        cache_key = (guid, flags.value, friendly_names)
+        cached = self._enum_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.ENUM_CACHE_TTL:
+            return list(cached[1])
+
         handle = self.api.exec_function_setupapi(
             SetupDiGetClassDevs, byref(guid.value), None, None, flags
         )
 
-        return self._enumerate_usb_devices(handle, guid)
-    
-    def get_usb_devices_filtered(self, guid:GUIDEnum, vid: str, pid: str, **kwargs) -> list[UsbDevice]:
-        devices:list[UsbDevice] = self.get_usb_devices(guid, **kwargs)
-        return [dev for dev in devices if is_device(vid, pid, dev.path)]
+        devices = self._enumerate_usb_devices(handle, guid, friendly_names=friendly_names)
+        self._enum_cache[cache_key] = (time.monotonic(), devices)
+        return list(devices)
+
+    def get_usb_devices_filtered(self, guid:GUIDEnum, vid: str, pid: str, friendly_names: bool = True,
+                                    **kwargs) -> list[UsbDevice]:
+        flags = self._compute_flags(**kwargs)
+        handle = self.api.exec_function_setupapi(
+            SetupDiGetClassDevs, byref(guid.value), None, None, flags
+        )
+
+        return self._enumerate_usb_devices(handle, guid, vid=vid, pid=pid, friendly_names=friendly_names)
 
     def _compute_flags(self, **kwargs) -> DWORD:
         """Compute flag values based on provided keyword arguments."""
-        flag_map = {
-            "default": DIGCF_DEFAULT,
-            "present": DIGCF_PRESENT,
-            "allclasses": DIGCF_ALLCLASSES,
-            "profile": DIGCF_PROFILE,
-            "deviceinterface": DIGCF_DEVICE_INTERFACE,
-        }
-        value = sum(flag for key, flag in flag_map.items() if kwargs.get(key)) or 0x00000010
-        return DWORD(value)
-
-    def _enumerate_usb_devices(self, handle, guid:GUIDEnum) -> list[UsbDevice]:
-        """Enumerate USB devices and return a dictionary of device names and paths."""
-        devices:list[UsbDevice] = []
+        value = 0
+        for key in kwargs:
+            if kwargs[key]:
+                value |= _DIGCF_FLAG_MAP.get(key, 0)
+        return DWORD(value or DIGCF_DEVICE_INTERFACE)
+
+    def _enumerate_usb_devices(self, handle, guid:GUIDEnum, vid: str = None, pid: str = None,
+                                friendly_names: bool = True) -> list[UsbDevice]:
+        """Enumerate USB devices and return a dictionary of device names and paths.
+
+        When vid/pid are given, non-matching paths are rejected before the
+        registry lookup for the friendly name.
+        """
+        found: list[tuple[str, str]] = []  # (name, path) pairs gathered in the tight loop
 
         # Type hinting for these variables
         sp_device_interface_data: SpDeviceInterfaceData = SpDeviceInterfaceData()
-        sp_device_interface_data.cb_size = sizeof(sp_device_interface_data)
+        sp_device_interface_data.cb_size = _SP_DEVICE_INTERFACE_DATA_SIZE
         
+        # Start with a buffer large enough for virtually every device path so
+        # the common case is a single SetupDiGetDeviceInterfaceDetail call
         sp_device_interface_detail_data: SpDeviceInterfaceDetailData = SpDeviceInterfaceDetailData()
-        
+        detail_size = 512
+        resize(sp_device_interface_detail_data, detail_size)
+        sp_device_interface_detail_data.cb_size = SP_DEVICE_INTERFACE_DETAIL_DATA_CB_SIZE
+
         sp_device_info_data: SpDevinfoData = SpDevinfoData()
-        sp_device_info_data.cb_size = sizeof(sp_device_info_data)
+        sp_device_info_data.cb_size = _SP_DEVINFO_DATA_SIZE
 
         i = 0
         required_size = DWORD(0)
         member_index = DWORD(i)
-        cb_sizes = (8, 6, 5)  # Different sizes for different architectures
 
         while self.api.exec_function_setupapi(
             SetupDiEnumDeviceInterfaces, handle, None, byref(guid.value),
             member_index, byref(sp_device_interface_data)
         ):
-            self.api.exec_function_setupapi(
+            ret = self.api.exec_function_setupapi(
                 SetupDiGetDeviceInterfaceDetail, handle,
-                byref(sp_device_interface_data), None, 0, byref(required_size), None
+                byref(sp_device_interface_data), byref(sp_device_interface_detail_data),
+                detail_size, byref(required_size), byref(sp_device_info_data)
             )
-            resize(sp_device_interface_detail_data, required_size.value)
-
-            path: str = None  # Initialize path variable with type hinting
-            for cb_size in cb_sizes:
-                sp_device_interface_detail_data.cb_size = cb_size
+            if not ret and self.get_last_error_code() == ERROR_INSUFFICIENT_BUFFER:
+                detail_size = required_size.value
+                resize(sp_device_interface_detail_data, detail_size)
                 ret = self.api.exec_function_setupapi(
                     SetupDiGetDeviceInterfaceDetail, handle,
                     byref(sp_device_interface_data), byref(sp_device_interface_detail_data),
-                    required_size, byref(required_size), byref(sp_device_info_data)
+                    detail_size, byref(required_size), byref(sp_device_info_data)
                 )
-                if ret:
-                    cb_sizes = (cb_size,)
-                    path = wstring_at(byref(sp_device_interface_detail_data, sizeof(DWORD)))
-                    break
-            if path is None:
+            if not ret:
                 raise ctypes.WinError()
+            path: str = wstring_at(byref(sp_device_interface_detail_data, _SIZEOF_DWORD))
 
-            name = self._get_device_friendly_name(handle, sp_device_info_data, path)
-            devices.append(UsbDevice(name, path, self.api, logging_level=self.logging_level, 
-                                        logging_filepath=self.log_filepath))
+            if vid is None or is_device(vid, pid, path):
+                if friendly_names:
+                    name = self._get_device_friendly_name(handle, sp_device_info_data, path)
+                else:
+                    name = path
+                found.append((name, path))
 
             i += 1
             member_index = DWORD(i)
-            required_size = c_ulong(0)
-            resize(sp_device_interface_detail_data, sizeof(SpDeviceInterfaceDetailData))
 
-        return devices
+        # Build the device objects only once the SetupAPI walk is finished
+        return [UsbDevice(name, path, self.api, logging_level=self.logging_level,
+                            logging_filepath=self.log_filepath)
+                for name, path in found]
 
     def _get_device_friendly_name(self, handle, sp_device_info_data, default_name: str) -> str:
         """Retrieve the friendly name of the USB device if available."""
-        buff_friendly_name = ctypes.create_unicode_buffer(250)
+        buff_friendly_name = self._friendly_name_buf  # Reused across devices
         if self.api.exec_function_setupapi(
             SetupDiGetDeviceRegistryProperty, handle,
             byref(sp_device_info_data), SPDRP_FRIENDLYNAME,
@@ -1,5 +1,6 @@
 from ctypes import c_ubyte, c_ushort, c_ulong, c_void_p, c_wchar_p
 from ctypes import POINTER
+from functools import lru_cache
 from ctypes.wintypes import HANDLE, DWORD, BOOL
 from .winusbclasses import UsbSetupPacket, Overlapped, UsbInterfaceDescriptor, LpSecurityAttributes, GUID, \
     SpDevinfoData, SpDeviceInterfaceData, SpDeviceInterfaceDetailData, PipeInfo
@@ -29,6 +30,7 @@ ReadFile = "ReadFile"
 CancelIo = "CancelIo"
 WriteFile = "WriteFile"
 SetEvent = "SetEvent"
+ResetEvent = "ResetEvent"
 WaitForSingleObject = "WaitForSingleObject"
 GetLastError = "GetLastError"
 
@@ -59,8 +61,8 @@ def get_winusb_functions(windll):
 
     # BOOL __stdcall WinUsb_ControlTransfer(_In_ WINUSB_INTERFACE_HANDLE InterfaceHandle,_In_ WINUSB_SETUP_PACKET SetupPacket, _Out_ PUCHAR Buffer,_In_ ULONG BufferLength,_Out_opt_  PULONG LengthTransferred,_In_opt_  LPOVERLAPPED Overlapped);
     winusb_functions[WinUsb_ControlTransfer] = windll.WinUsb_ControlTransfer
-    # winusb_restypes[WinUsb_ControlTransfer] = BOOL
-    # winusb_argtypes[WinUsb_ControlTransfer] = [c_void_p, UsbSetupPacket, POINTER(c_ubyte), c_ulong, POINTER(c_ulong), LpOverlapped] 
+    winusb_restypes[WinUsb_ControlTransfer] = BOOL
+    winusb_argtypes[WinUsb_ControlTransfer] = [c_void_p, UsbSetupPacket, c_void_p, c_ulong, POINTER(c_ulong), POINTER(Overlapped)]
 
     # BOOL __stdcall WinUsb_GetDescriptor(_In_ WINUSB_INTERFACE_HANDLE InterfaceHandle,_In_ UCHAR DescriptorType,_In_ UCHAR Index,_In_ USHORT LanguageID,_Out_ PUCHAR Buffer,_In_ ULONG BufferLength,_Out_ PULONG LengthTransferred);
     winusb_functions[WinUsb_GetDescriptor] = windll.WinUsb_GetDescriptor
@@ -70,12 +72,12 @@ def get_winusb_functions(windll):
     # BOOL __stdcall WinUsb_GetOverlappedResult(_In_ WINUSB_INTERFACE_HANDLE InterfaceHandle,_In_ LPOVERLAPPED lpOverlapped,_Out_ LPDWORD lpNumberOfBytesTransferred,_In_ BOOL bWait);
     winusb_functions[WinUsb_GetOverlappedResult] = windll.WinUsb_GetOverlappedResult
     winusb_restypes[WinUsb_GetOverlappedResult] = BOOL
-    # winusb_argtypes[WinUsb_GetOverlappedResult] = []
+    winusb_argtypes[WinUsb_GetOverlappedResult] = [c_void_p, POINTER(Overlapped), POINTER(c_ulong), BOOL]
 
     # BOOL __stdcall WinUsb_ReadPipe( _In_ WINUSB_INTERFACE_HANDLE InterfaceHandle,_In_ UCHAR PipeID,_Out_ PUCHAR Buffer,_In_ ULONG BufferLength,_Out_opt_ PULONG LengthTransferred,_In_opt_ LPOVERLAPPED Overlapped);
     winusb_functions[WinUsb_ReadPipe] = windll.WinUsb_ReadPipe
-    # winusb_restypes[WinUsb_ReadPipe] = BOOL
-    # winusb_argtypes[WinUsb_ReadPipe] = [c_void_p, c_ubyte, POINTER(c_ubyte), c_ulong, POINTER(c_ulong), LpOverlapped]
+    winusb_restypes[WinUsb_ReadPipe] = BOOL
+    winusb_argtypes[WinUsb_ReadPipe] = [c_void_p, c_ubyte, c_void_p, c_ulong, POINTER(c_ulong), POINTER(Overlapped)]
 
     # BOOL __stdcall WinUsb_ReadPipe( _In_ WINUSB_INTERFACE_HANDLE InterfaceHandle,_In_ UCHAR PipeID,_Out_ PUCHAR Buffer,_In_ ULONG BufferLength,_Out_opt_ PULONG LengthTransferred,_In_opt_ LPOVERLAPPED Overlapped);
     winusb_functions[WinUsb_SetPipePolicy] = windll.WinUsb_SetPipePolicy
@@ -84,8 +86,8 @@ def get_winusb_functions(windll):
 
     # BOOL __stdcall WinUsb_WritePipe(_In_ WINUSB_INTERFACE_HANDLE InterfaceHandle,_In_ UCHAR PipeID,_In_ PUCHAR Buffer,_In_ ULONG BufferLength,_Out_opt_  PULONG LengthTransferred,_In_opt_ LPOVERLAPPED Overlapped);
     winusb_functions[WinUsb_WritePipe] = windll.WinUsb_WritePipe
-    # winusb_restypes[WinUsb_WritePipe] = BOOL
-    # winusb_argtypes[WinUsb_WritePipe] = [c_void_p, c_ubyte, POINTER(c_ubyte), c_ulong, POINTER(c_ulong), LpOverlapped]
+    winusb_restypes[WinUsb_WritePipe] = BOOL
+    winusb_argtypes[WinUsb_WritePipe] = [c_void_p, c_ubyte, c_void_p, c_ulong, POINTER(c_ulong), POINTER(Overlapped)]
 
     # BOOL __stdcall WinUsb_FlushPipe(_In_ WINUSB_INTERFACE_HANDLE InterfaceHandle);
     winusb_functions[WinUsb_FlushPipe] = windll.WinUsb_FlushPipe
@@ -152,6 +154,16 @@ def get_kernel32_functions(kernel32):
     kernel32_restypes[SetEvent] = BOOL
     kernel32_argtypes[SetEvent] = [HANDLE]
 
+    # BOOL WINAPI ResetEvent(_In_ HANDLE hEvent);
+    kernel32_functions[ResetEvent] = kernel32.ResetEvent
+    kernel32_restypes[ResetEvent] = BOOL
+    kernel32_argtypes[ResetEvent] = [HANDLE]
+
+    # HANDLE WINAPI CreateEvent(_In_opt_ LPSECURITY_ATTRIBUTES lpEventAttributes,_In_ BOOL bManualReset,_In_ BOOL bInitialState,_In_opt_ LPCTSTR lpName);
+    kernel32_functions[CreateEvent] = kernel32.CreateEventW
+    kernel32_restypes[CreateEvent] = HANDLE
+    kernel32_argtypes[CreateEvent] = [c_void_p, BOOL, BOOL, c_wchar_p]
+
     # DWORD WINAPI WaitForSingleObject(_In_ HANDLE hHandle, _In_  DWORD dwMilliseconds);
     kernel32_functions[WaitForSingleObject] = kernel32.WaitForSingleObject
     kernel32_restypes[WaitForSingleObject] = DWORD
@@ -214,12 +226,16 @@ def get_setupapi_functions(setupapi):
     setupapi_dict["argtypes"] = setupapi_argtypes
     return setupapi_dict
 
+@lru_cache(maxsize=None)
+def _vid_pid_tokens(vid:int, pid:int) -> tuple[str, str]:
+    """Parse and format the vid_/pid_ path tokens once per (vid, pid)."""
+    return f"vid_{int(str(vid), 0):04x}", f"pid_{int(str(pid), 0):04x}"
+
 def is_device(vid:int, pid:int, path:str, name:str=None):
     if vid and pid:
-        vid_str = f"vid_{int(str(vid), 0):04x}"
-        pid_str = f"pid_{int(str(pid), 0):04x}"
+        vid_str, pid_str = _vid_pid_tokens(vid, pid)
         path_lower = path.lower()
-        
+
         return vid_str in path_lower and pid_str in path_lower
     elif name and name.lower() == path.lower():
         return True